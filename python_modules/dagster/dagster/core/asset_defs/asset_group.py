@@ -277,7 +277,8 @@ def _parse_asset_selection(self, selection: Union[str, List[str]], job_name: str
         for asset in self.assets:
             if asset.op.name not in op_names_to_asset_keys:
                 op_names_to_asset_keys[asset.op.name] = set()
-            for asset_key in asset.asset_keys:
+            # iterate the output defs rather than the asset_keys set to preserve declaration order
+            for asset_key in asset.output_defs_by_asset_key:
                 asset_key_as_str = ".".join([piece for piece in asset_key.path])
                 op_names_to_asset_keys[asset.op.name].add(asset_key_as_str)
                 if not asset_key_as_str in asset_keys_to_ops:
@@ -434,7 +435,11 @@ def from_modules(
             for asset in _find_assets_in_module(module):
                 if id(asset) not in asset_ids:
                     asset_ids.add(id(asset))
-                    keys = asset.asset_keys if isinstance(asset, AssetsDefinition) else [asset.key]
+                    keys = (
+                        asset.output_defs_by_asset_key
+                        if isinstance(asset, AssetsDefinition)
+                        else [asset.key]
+                    )
                     for key in keys:
                         if key in asset_keys:
                             modules_str = ", ".join(
@@ -26,11 +26,17 @@ def __new__(
         )
 
         # if user inputs a single string, coerce to list
-        namespace = [namespace] if isinstance(namespace, str) else namespace
+        namespace = check.opt_list_param(
+            [namespace] if isinstance(namespace, str) else namespace, "namespace", str
+        )
+        check.invariant(
+            all(namespace),
+            "Elements of an asset namespace must be non-empty strings",
+        )
 
         return super(AssetIn, cls).__new__(
             cls,
             asset_key=check.opt_inst_param(asset_key, "asset_key", AssetKey),
             metadata=check.opt_inst_param(metadata, "metadata", Mapping),
-            namespace=check.opt_list_param(namespace, "namespace", str),
+            namespace=namespace,
         )
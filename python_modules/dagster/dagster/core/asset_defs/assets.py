@@ -1,7 +1,8 @@
+from types import MappingProxyType
 from typing import AbstractSet, Mapping, Optional
 
 from dagster import check
-from dagster.core.definitions import OpDefinition
+from dagster.core.definitions import InputDefinition, OpDefinition, OutputDefinition
 from dagster.core.definitions.events import AssetKey
 from dagster.core.definitions.partition import PartitionsDefinition
 
@@ -18,17 +19,32 @@ def __init__(
         partition_mappings: Optional[Mapping[AssetKey, PartitionMapping]] = None,
     ):
         self._op = op
-        self._input_defs_by_asset_key = {
+        input_defs_by_asset_key = {
             asset_key: op.input_dict[input_name]
             for asset_key, input_name in input_names_by_asset_key.items()
         }
-
-        self._output_defs_by_asset_key = {
+        output_defs_by_asset_key = {
             asset_key: op.output_dict[output_name]
             for asset_key, output_name in output_names_by_asset_key.items()
         }
+        # build the key sets from the plain dicts, which reuse their stored hashes, rather than
+        # from the proxies, which would rehash every AssetKey
+        self._asset_keys = frozenset(output_defs_by_asset_key)
+        self._dependency_asset_keys = frozenset(input_defs_by_asset_key)
+        # read-only views, so callers can iterate these without needing to copy them defensively
+        self._input_defs_by_asset_key: Mapping[AssetKey, InputDefinition] = MappingProxyType(
+            input_defs_by_asset_key
+        )
+        self._output_defs_by_asset_key: Mapping[AssetKey, OutputDefinition] = MappingProxyType(
+            output_defs_by_asset_key
+        )
+        self._single_asset_key = (
+            next(iter(output_defs_by_asset_key)) if len(output_defs_by_asset_key) == 1 else None
+        )
         self._partitions_def = partitions_def
         self._partition_mappings = partition_mappings or {}
+        # computed lazily by get_partition_mapping
+        self._default_partition_mapping: Optional[PartitionMapping] = None
 
     def __call__(self, *args, **kwargs):
         return self._op(*args, **kwargs)
@@ -37,16 +53,31 @@ def __call__(self, *args, **kwargs):
     def op(self) -> OpDefinition:
         return self._op
 
+    @property
+    def asset_key(self) -> AssetKey:
+        if self._single_asset_key is None:
+            keys = ", ".join(str(ak.to_string()) for ak in self._output_defs_by_asset_key)
+            check.failed(
+                "Tried to retrieve asset key from an assets definition that does not have exactly "
+                f"one asset key. Asset keys: [{keys}]"
+            )
+
+        return self._single_asset_key
+
     @property
     def asset_keys(self) -> AbstractSet[AssetKey]:
-        return self._output_defs_by_asset_key.keys()
+        return self._asset_keys
+
+    @property
+    def dependency_asset_keys(self) -> AbstractSet[AssetKey]:
+        return self._dependency_asset_keys
 
     @property
-    def output_defs_by_asset_key(self):
+    def output_defs_by_asset_key(self) -> Mapping[AssetKey, OutputDefinition]:
         return self._output_defs_by_asset_key
 
     @property
-    def input_defs_by_asset_key(self):
+    def input_defs_by_asset_key(self) -> Mapping[AssetKey, InputDefinition]:
         return self._input_defs_by_asset_key
 
     @property
@@ -57,7 +88,11 @@ def get_partition_mapping(self, in_asset_key: AssetKey) -> PartitionMapping:
         if self._partitions_def is None:
             check.failed("Asset is not partitioned")
 
-        return self._partition_mappings.get(
-            in_asset_key,
-            self._partitions_def.get_default_partition_mapping(),
-        )
+        partition_mapping = self._partition_mappings.get(in_asset_key)
+        if partition_mapping is not None:
+            return partition_mapping
+
+        if self._default_partition_mapping is None:
+            self._default_partition_mapping = self._partitions_def.get_default_partition_mapping()
+
+        return self._default_partition_mapping
@@ -118,8 +118,10 @@ def build_job_partitions_from_assets(
     first_assets_with_partitions_def: AssetsDefinition = assets_with_partitions_defs[0]
     for assets_def in assets_with_partitions_defs:
         if assets_def.partitions_def != first_assets_with_partitions_def.partitions_def:
-            first_asset_key = next(iter(assets_def.asset_keys)).to_string()
-            second_asset_key = next(iter(first_assets_with_partitions_def.asset_keys)).to_string()
+            first_asset_key = next(iter(assets_def.output_defs_by_asset_key)).to_string()
+            second_asset_key = next(
+                iter(first_assets_with_partitions_def.output_defs_by_asset_key)
+            ).to_string()
             raise DagsterInvalidDefinitionError(
                 "When an assets job contains multiple partitions assets, they must have the "
                 f"same partitions definitions, but asset '{first_asset_key}' and asset "
@@ -33,6 +33,22 @@
 
 ASSET_DEPENDENCY_METADATA_KEY = ".dagster/asset_deps"
 
+_CONTEXT_PARAM_NAMES = frozenset(get_valid_name_permutations("context"))
+
+_ASSET_CONFIG_SCHEMA = {
+    "assets": {
+        "input_partitions": Field(dict, is_required=False),
+        "output_partitions": Field(dict, is_required=False),
+    }
+}
+
+# Validated templates for the Ins that build_asset_ins creates most often, so that each input only
+# needs a cheap NamedTuple._replace instead of re-running In's param checks and type resolution.
+# metadata is replaced with a fresh dict every time so that the templates' dicts are never shared.
+# cast due to mypy bug-- doesn't understand Nothing is a type
+_ARGUMENT_IN_TEMPLATE = In(root_manager_key="root_manager")
+_NON_ARGUMENT_IN_TEMPLATE = In(dagster_type=cast(type, Nothing))
+
 
 @overload
 def asset(
@@ -160,7 +176,13 @@ def __init__(
     ):
         self.name = name
         # if user inputs a single string, coerce to list
-        self.namespace = [namespace] if isinstance(namespace, str) else namespace
+        self.namespace = check.opt_nullable_sequence_param(
+            [namespace] if isinstance(namespace, str) else namespace, "namespace", of_type=str
+        )
+        check.invariant(
+            self.namespace is None or all(self.namespace),
+            "Elements of an asset namespace must be non-empty strings",
+        )
         self.ins = ins or {}
         self.non_argument_deps = non_argument_deps
         self.metadata = metadata
@@ -177,13 +199,11 @@ def __call__(self, fn: Callable) -> AssetsDefinition:
 
         asset_ins = build_asset_ins(fn, self.namespace, self.ins or {}, self.non_argument_deps)
 
-        partition_fn: Optional[Callable] = None
-        if self.partitions_def:
-
-            def partition_fn(context):  # pylint: disable=function-redefined
-                return [context.partition_key]
+        partition_fn: Optional[Callable] = (
+            _partition_key_partition_fn if self.partitions_def else None
+        )
 
-        out_asset_key = AssetKey(list(filter(None, [*(self.namespace or []), asset_name])))
+        out_asset_key = AssetKey([*(self.namespace or []), asset_name])
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=ExperimentalWarning)
 
@@ -203,22 +223,13 @@ def partition_fn(context):  # pylint: disable=function-redefined
                 out=out,
                 required_resource_keys=self.required_resource_keys,
                 tags={"kind": self.compute_kind} if self.compute_kind else None,
-                config_schema={
-                    "assets": {
-                        "input_partitions": Field(dict, is_required=False),
-                        "output_partitions": Field(dict, is_required=False),
-                    }
-                },
+                config_schema=_ASSET_CONFIG_SCHEMA,
             )(fn)
 
-        # NOTE: we can `cast` below because we know the Ins returned by `build_asset_ins` always
-        # have a plain AssetKey asset key. Dynamic asset keys will be deprecated in 0.15.0, when
-        # they are gone we can remove this cast.
+        # NOTE: the partition_mappings `cast` below is safe for the same reason as the one in
+        # `_get_input_names_by_asset_key`.
         return AssetsDefinition(
-            input_names_by_asset_key={
-                cast(AssetKey, in_def.asset_key): input_name
-                for input_name, in_def in asset_ins.items()
-            },
+            input_names_by_asset_key=_get_input_names_by_asset_key(asset_ins),
             output_names_by_asset_key={out_asset_key: "result"},
             op=op,
             partitions_def=self.partitions_def,
@@ -292,14 +303,10 @@ def inner(fn: Callable[..., Any]) -> AssetsDefinition:
                 tags={"kind": compute_kind} if compute_kind else None,
             )(fn)
 
-        # NOTE: we can `cast` below because we know the Ins returned by `build_asset_ins` always
-        # have a plain AssetKey asset key. Dynamic asset keys will be deprecated in 0.15.0, when
-        # they are gone we can remove this cast.
+        # NOTE: we can `cast` the output asset keys below because `build_asset_outs` always sets
+        # a plain AssetKey on each Out.
         return AssetsDefinition(
-            input_names_by_asset_key={
-                cast(AssetKey, in_def.asset_key): input_name
-                for input_name, in_def in asset_ins.items()
-            },
+            input_names_by_asset_key=_get_input_names_by_asset_key(asset_ins),
             output_names_by_asset_key={
                 cast(AssetKey, out_def.asset_key): output_name for output_name, out_def in asset_outs.items()  # type: ignore
             },
@@ -338,23 +345,26 @@ def build_asset_outs(
         for out_name, out in outs.items()
     }
 
-    # validate that the internal_asset_deps make sense
-    valid_asset_deps = set(in_def.asset_key for in_def in ins.values())
-    valid_asset_deps.update(asset_keys_by_out_name.values())
-    for out_name, asset_keys in internal_asset_deps.items():
-        check.invariant(
-            out_name in outs,
-            f"Invalid out key '{out_name}' supplied to `internal_asset_deps` argument for multi-asset "
-            f"{op_name}. Must be one of the outs for this multi-asset {list(outs.keys())}.",
-        )
-        invalid_asset_deps = asset_keys.difference(valid_asset_deps)
-        check.invariant(
-            not invalid_asset_deps,
-            f"Invalid asset dependencies: {invalid_asset_deps} specified in `internal_asset_deps` "
-            f"argument for multi-asset '{op_name}' on key '{out_name}'. Each specified asset key "
-            "must be associated with an input to the asset or produced by this asset. Valid "
-            f"keys: {valid_asset_deps}",
-        )
+    # validate that the internal_asset_deps make sense. The error messages are only formatted on
+    # failure, since they stringify every valid asset key.
+    if internal_asset_deps:
+        valid_asset_deps = set(in_def.asset_key for in_def in ins.values())
+        valid_asset_deps.update(asset_keys_by_out_name.values())
+        for out_name, asset_keys in internal_asset_deps.items():
+            if out_name not in outs:
+                check.failed(
+                    f"Invalid out key '{out_name}' supplied to `internal_asset_deps` argument for "
+                    f"multi-asset {op_name}. Must be one of the outs for this multi-asset "
+                    f"{list(outs.keys())}."
+                )
+            invalid_asset_deps = asset_keys.difference(valid_asset_deps)
+            if invalid_asset_deps:
+                check.failed(
+                    f"Invalid asset dependencies: {invalid_asset_deps} specified in "
+                    f"`internal_asset_deps` argument for multi-asset '{op_name}' on key "
+                    f"'{out_name}'. Each specified asset key must be associated with an input to "
+                    f"the asset or produced by this asset. Valid keys: {valid_asset_deps}"
+                )
 
     return outs
 
@@ -369,15 +379,11 @@ def build_asset_ins(
     non_argument_deps = check.opt_set_param(non_argument_deps, "non_argument_deps", AssetKey)
 
     params = get_function_params(fn)
-    is_context_provided = len(params) > 0 and params[0].name in get_valid_name_permutations(
-        "context"
-    )
+    is_context_provided = len(params) > 0 and params[0].name in _CONTEXT_PARAM_NAMES
     input_param_names = [
         input_param.name for input_param in (params[1:] if is_context_provided else params)
     ]
 
-    all_input_names = set(input_param_names) | asset_ins.keys()
-
     for in_key in asset_ins.keys():
         if in_key not in input_param_names:
             raise DagsterInvalidDefinitionError(
@@ -385,32 +391,54 @@ def build_asset_ins(
                 "of the arguments to the decorated function"
             )
 
-    ins: Dict[str, In] = {}
-    for input_name in all_input_names:
-        asset_key = None
-
-        if input_name in asset_ins:
-            asset_key = asset_ins[input_name].asset_key
-            metadata = asset_ins[input_name].metadata or {}
-            namespace = asset_ins[input_name].namespace
-        else:
-            metadata = {}
-            namespace = None
-
-        asset_key = asset_key or AssetKey(
-            list(filter(None, [*(namespace or asset_namespace or []), input_name]))
-        )
-
-        ins[input_name] = In(
-            metadata=metadata,
-            root_manager_key="root_manager",
-            asset_key=asset_key,
-        )
-
+    # every key of asset_ins is a param name (validated above), so the param names alone cover
+    # all argument inputs
+    ins: Dict[str, In] = {
+        input_name: _build_argument_in(input_name, asset_ins.get(input_name), asset_namespace)
+        for input_name in input_param_names
+    }
     for asset_key in non_argument_deps:
         stringified_asset_key = "_".join(asset_key.path)
         if stringified_asset_key:
-            # cast due to mypy bug-- doesn't understand Nothing is a type
-            ins[stringified_asset_key] = In(dagster_type=cast(type, Nothing), asset_key=asset_key)
+            ins[stringified_asset_key] = _NON_ARGUMENT_IN_TEMPLATE._replace(
+                metadata={}, asset_key=asset_key
+            )
 
     return ins
+
+
+def _partition_key_partition_fn(context):
+    return [context.partition_key]
+
+
+def _get_input_names_by_asset_key(asset_ins: Mapping[str, In]) -> Dict[AssetKey, str]:
+    # NOTE: we can `cast` below because we know the Ins returned by `build_asset_ins` always have a
+    # plain AssetKey asset key. Dynamic asset keys will be deprecated in 0.15.0, when they are gone
+    # we can remove this cast.
+    return {
+        cast(AssetKey, in_def.asset_key): input_name for input_name, in_def in asset_ins.items()
+    }
+
+
+def _build_argument_in(
+    input_name: str, asset_in: Optional[AssetIn], asset_namespace: Optional[Sequence[str]]
+) -> In:
+    if asset_in is not None:
+        asset_key = asset_in.asset_key
+        metadata = asset_in.metadata
+        namespace = asset_in.namespace
+    else:
+        asset_key = None
+        metadata = None
+        namespace = None
+
+    asset_key = asset_key or AssetKey([*(namespace or asset_namespace or []), input_name])
+
+    if not metadata:
+        return _ARGUMENT_IN_TEMPLATE._replace(metadata={}, asset_key=asset_key)
+
+    return In(
+        metadata=metadata,
+        root_manager_key="root_manager",
+        asset_key=asset_key,
+    )
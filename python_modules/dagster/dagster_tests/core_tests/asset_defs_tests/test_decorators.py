@@ -337,3 +337,76 @@ def my_asset():
         pass
 
     assert my_asset.partitions_def == partitions_def
+
+
+def test_asset_keys():
+    @asset(namespace="my_namespace", ins={"arg1": AssetIn(asset_key=AssetKey("upstream"))})
+    def my_asset(arg1, arg2):
+        return arg1 + arg2
+
+    assert my_asset.asset_keys == {AssetKey(["my_namespace", "my_asset"])}
+    assert my_asset.dependency_asset_keys == {
+        AssetKey("upstream"),
+        AssetKey(["my_namespace", "arg2"]),
+    }
+
+
+def test_empty_namespace_element():
+    with pytest.raises(check.CheckError):
+
+        @asset(namespace=["my_namespace", ""])
+        def my_asset():
+            pass
+
+    with pytest.raises(check.CheckError):
+        AssetIn(namespace="")
+
+
+def test_asset_key():
+    @asset(namespace="my_namespace")
+    def my_asset():
+        pass
+
+    assert my_asset.asset_key == AssetKey(["my_namespace", "my_asset"])
+
+    @multi_asset(outs={"o1": Out(), "o2": Out()})
+    def my_multi_asset():
+        pass
+
+    with pytest.raises(check.CheckError, match="does not have exactly one asset key"):
+        my_multi_asset.asset_key  # pylint: disable=pointless-statement
+
+
+def test_asset_key_empty_path():
+    @multi_asset(outs={"o1": Out(asset_key=AssetKey([])), "o2": Out()})
+    def my_multi_asset():
+        pass
+
+    with pytest.raises(check.CheckError, match="does not have exactly one asset key"):
+        my_multi_asset.asset_key  # pylint: disable=pointless-statement
+
+
+def test_defs_by_asset_key_read_only():
+    @asset
+    def my_asset(arg1):
+        return arg1
+
+    assert my_asset.input_defs_by_asset_key[AssetKey("arg1")].name == "arg1"
+    assert my_asset.output_defs_by_asset_key[AssetKey("my_asset")].name == "result"
+
+    with pytest.raises(TypeError):
+        my_asset.input_defs_by_asset_key[AssetKey("other")] = None  # type: ignore
+
+    with pytest.raises(TypeError):
+        my_asset.output_defs_by_asset_key[AssetKey("other")] = None  # type: ignore
+
+
+def test_invalid_namespace_type():
+    with pytest.raises(check.CheckError):
+
+        @asset(namespace=5)  # type: ignore
+        def my_asset():
+            pass
+
+    with pytest.raises(check.CheckError):
+        AssetIn(namespace=5)  # type: ignore